@@ -1,12 +1,13 @@
 import os
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-import uuid
+import re
+from typing import Optional, Dict, Any
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 
 # Import database client
 from database import db_client
@@ -16,8 +17,11 @@ from main import (
     conversations,
     get_or_create_conversation,
     load_user_context,
-    execute_schedule_agent,
-    execute_networking_agent
+    fetch_user,
+    invalidate_user_cache,
+    invalidate_business_cache,
+    prewarm_user_cache,
+    route_and_execute
 )
 
 # Import shared types
@@ -27,7 +31,7 @@ from shared_types import AirlineAgentContext
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Conference Assistant API")
+app = FastAPI(title="Conference Assistant API", default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -38,6 +42,130 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup_event():
+    """Optionally prewarm the user cache with one bulk fetch.
+
+    Opt-in via PREWARM_USERS=1; a fixed conference attendee set then serves
+    every lookup from memory instead of per-request DB point reads.
+    """
+    if os.getenv("PREWARM_USERS") == "1":
+        count = await prewarm_user_cache()
+        logger.info("Prewarmed user cache with %s users", count)
+
+# =========================
+# BUSINESS FORM PARSING
+# =========================
+
+# Map display names from the business form to database field names
+_BUSINESS_FIELD_MAP = {
+    "Company Name": "companyName",
+    "Industry Sector": "industrySector",
+    "Sub-Sector": "subSector",
+    "Location": "location",
+    "Position Title": "positionTitle",
+    "Legal Structure": "legalStructure",
+    "Establishment Year": "establishmentYear",
+    "Products/Services": "productsOrServices",
+    "Brief Description": "briefDescription",
+    "Website": "web"
+}
+
+# One multiline pass over the message instead of per-line split/strip/lookup
+_BUSINESS_FORM_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, _BUSINESS_FIELD_MAP)) + r")\s*:\s*(.+?)\s*$",
+    re.MULTILINE
+)
+
+# Form submissions always begin with this line, so an O(len(prefix))
+# startswith check gates the whole parse
+_BUSINESS_FORM_PREFIX = "I want to add my business with the following details:"
+
+class BusinessForm(BaseModel):
+    """Validated business-directory submission parsed from the chat form.
+
+    Field names match the keys stored in the business details JSON; values
+    stay strings so the stored shape is unchanged. One pydantic-core pass
+    rejects incomplete forms before any DB write.
+    """
+    companyName: str
+    industrySector: str
+    subSector: str
+    location: str
+    positionTitle: str
+    legalStructure: str
+    establishmentYear: str
+    productsOrServices: str
+    briefDescription: str
+    web: Optional[str] = None
+
+async def _handle_add_business(conversation: Dict[str, Any], message: str) -> Optional[str]:
+    """Deterministic fast path for business form submissions.
+
+    Returns the response message, or None when the message is not a form
+    submission. No agent is involved, so the whole turn is one DB write.
+    """
+    if not message.startswith(_BUSINESS_FORM_PREFIX):
+        return None
+
+    # Parse business details from message in a single regex pass
+    business_data = {
+        _BUSINESS_FIELD_MAP[key]: value
+        for key, value in _BUSINESS_FORM_RE.findall(message)
+    }
+
+    # Add business using the database client
+    if business_data and conversation["context"].customer_id:
+        try:
+            form = BusinessForm.model_validate(business_data)
+        except ValidationError as e:
+            missing = ", ".join(str(err["loc"][0]) for err in e.errors())
+            return f"❌ Your business form is incomplete or invalid ({missing}). Please fill out all required fields and try again."
+
+        try:
+            success = await db_client.add_business(
+                conversation["context"].customer_id,
+                form.model_dump(exclude_none=True)
+            )
+
+            if success:
+                # New listing should show up in searches right away
+                invalidate_business_cache()
+                return f"✅ Successfully added your business '{business_data.get('companyName', 'Unknown')}' to the business directory!\n\nYour business is now visible to other conference attendees for networking opportunities. Other participants can find your business when searching by industry, location, or company name.\n\nIs there anything else I can help you with regarding networking or the conference?"
+            return "❌ I encountered an issue adding your business. Please try again or contact support for assistance."
+
+        except Exception as e:
+            logger.error("Error adding business: %s", e)
+            return f"❌ Error adding business: {str(e)}"
+
+    return "❌ I couldn't process your business information. Please make sure all required fields are filled out correctly."
+
+# Static descriptor of the available agents, built once instead of on every
+# /chat response.
+_AGENTS_METADATA = [
+    {
+        "name": "Triage Agent",
+        "description": "Main conference assistant that routes requests",
+        "handoffs": ["Schedule Agent", "Networking Agent"],
+        "tools": [],
+        "input_guardrails": []
+    },
+    {
+        "name": "Schedule Agent",
+        "description": "Conference schedule and session information",
+        "handoffs": ["Triage Agent"],
+        "tools": ["get_conference_schedule"],
+        "input_guardrails": []
+    },
+    {
+        "name": "Networking Agent",
+        "description": "Networking, attendees, and business connections",
+        "handoffs": ["Triage Agent"],
+        "tools": ["search_attendees", "search_businesses", "add_business", "display_business_form"],
+        "input_guardrails": []
+    }
+]
+
 # =========================
 # PYDANTIC MODELS
 # =========================
@@ -47,242 +175,124 @@ class ChatRequest(BaseModel):
     conversation_id: Optional[str] = None
     account_number: Optional[str] = None
 
-class ChatResponse(BaseModel):
-    conversation_id: str
-    current_agent: str
-    messages: List[Dict[str, Any]]
-    events: List[Dict[str, Any]]
-    context: Dict[str, Any]
-    agents: List[Dict[str, Any]]
-    guardrails: List[Dict[str, Any]]
-    customer_info: Optional[Dict[str, Any]] = None
-
 # =========================
 # API ENDPOINTS
 # =========================
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Last-resort handler so endpoints don't need blanket try/excepts.
+
+    HTTPExceptions pass through untouched; anything else is logged and
+    answered with a generic 500 that doesn't leak internals.
+    """
+    logger.error("Unhandled error on %s: %s", request.url.path, exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
 @app.get("/user/{identifier}")
 async def get_user_info(identifier: str):
     """Get user information by registration ID or QR code (user ID)."""
-    try:
-        # First try to get user by registration_id
-        user = await db_client.get_user_by_registration_id(identifier)
-        
-        # If not found, try by QR code (user ID)
-        if not user:
-            user = await db_client.get_user_by_qr_code(identifier)
-        
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        return user
-    except Exception as e:
-        logger.error(f"Error fetching user info for {identifier}: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    # Cached lookup that covers both registration ID and QR code; the
+    # frontend hits this on every page load, so repeats are served from
+    # the in-process TTL cache without touching the DB
+    user = await fetch_user(identifier)
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat_endpoint(request: ChatRequest):
-    """Main chat endpoint for conference assistant."""
-    try:
-        # Get or create conversation
-        conversation = get_or_create_conversation(request.conversation_id, request.account_number)
-        
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return user
+
+@app.post("/user/{identifier}/invalidate")
+async def invalidate_user_info(identifier: str):
+    """Drop the cached user entry, e.g. after a profile edit."""
+    invalidate_user_cache(identifier)
+    return {"message": "User cache invalidated"}
+
+async def _process_chat(request: ChatRequest) -> Dict[str, Any]:
+    """Run one chat turn and build the response payload."""
+    # Get or create conversation
+    conversation = get_or_create_conversation(request.conversation_id, request.account_number)
+
+    # Serialize concurrent turns on the same conversation so context
+    # loads and message appends cannot interleave
+    async with conversation["lock"]:
         # Load user context if account_number is provided and not already loaded
         if request.account_number and not conversation["context"].customer_id:
             await load_user_context(conversation, request.account_number)
-        
-        # Handle business form submission
-        if "I want to add my business with the following details:" in request.message:
-            # Parse business details from message
-            lines = request.message.split('\n')
-            business_data = {}
-            
-            for line in lines[1:]:  # Skip first line
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Map display names to database field names
-                    field_mapping = {
-                        "Company Name": "companyName",
-                        "Industry Sector": "industrySector", 
-                        "Sub-Sector": "subSector",
-                        "Location": "location",
-                        "Position Title": "positionTitle",
-                        "Legal Structure": "legalStructure",
-                        "Establishment Year": "establishmentYear",
-                        "Products/Services": "productsOrServices",
-                        "Brief Description": "briefDescription",
-                        "Website": "web"
-                    }
-                    
-                    if key in field_mapping:
-                        business_data[field_mapping[key]] = value
-            
-            # Add business using the database client
-            if business_data and conversation["context"].customer_id:
-                try:
-                    success = await db_client.add_business(
-                        conversation["context"].customer_id,
-                        business_data
-                    )
-                    
-                    if success:
-                        response_message = f"✅ Successfully added your business '{business_data.get('companyName', 'Unknown')}' to the business directory!\n\nYour business is now visible to other conference attendees for networking opportunities. Other participants can find your business when searching by industry, location, or company name.\n\nIs there anything else I can help you with regarding networking or the conference?"
-                    else:
-                        response_message = "❌ I encountered an issue adding your business. Please try again or contact support for assistance."
-                        
-                except Exception as e:
-                    logger.error(f"Error adding business: {e}")
-                    response_message = f"❌ Error adding business: {str(e)}"
-            else:
-                response_message = "❌ I couldn't process your business information. Please make sure all required fields are filled out correctly."
-            
+    
+        # Handle business form submission (deterministic fast path,
+        # no agent round trip)
+        form_response = await _handle_add_business(conversation, request.message)
+        if form_response is not None:
             # Add messages to conversation
             conversation["messages"].append({
                 "content": request.message,
                 "agent": "User"
             })
             conversation["messages"].append({
-                "content": response_message,
+                "content": form_response,
                 "agent": "Networking Agent"
             })
-            
+
             # Update current agent
             conversation["current_agent"] = "Networking Agent"
-        
+
         else:
             # Regular message processing
             conversation["messages"].append({
                 "content": request.message,
                 "agent": "User"
             })
-            
-            # Improved routing logic based on message content
-            message_lower = request.message.lower()
-            
-            # Determine which agent to use with better keyword detection
-            if any(word in message_lower for word in ['schedule', 'session', 'speaker', 'time', 'room', 'track', 'when', 'agenda', 'program', 'july', 'date', 'events', 'september', 'tell me about speaker', 'about speaker']):
-                agent_name = "Schedule Agent"
-                try:
-                    # Convert context to dict for agent execution
-                    context_dict = {
-                        'customer_id': conversation["context"].customer_id,
-                        'passenger_name': conversation["context"].passenger_name,
-                        'account_number': conversation["context"].account_number,
-                        'customer_email': conversation["context"].customer_email,
-                        'is_conference_attendee': conversation["context"].is_conference_attendee,
-                        'conference_name': conversation["context"].conference_name,
-                        'user_company_name': conversation["context"].user_company_name,
-                        'user_location': conversation["context"].user_location,
-                        'user_registration_id': conversation["context"].user_registration_id,
-                        'user_conference_package': conversation["context"].user_conference_package,
-                        'user_primary_stream': conversation["context"].user_primary_stream,
-                        'user_secondary_stream': conversation["context"].user_secondary_stream
-                    }
-                    response = await execute_schedule_agent(request.message, context_dict)
-                except Exception as e:
-                    logger.error(f"Error executing agent {agent_name}: {e}")
-                    response = "I'm having trouble processing your request. Please try again or rephrase your question."
-                    
-            elif any(word in message_lower for word in ['network', 'business', 'attendee', 'connect', 'company', 'find people', 'add business', 'register business', 'show attendees', 'my business', 'tell about', 'tell me about', 'about']):
-                agent_name = "Networking Agent"
-                try:
-                    # Convert context to dict for agent execution
-                    context_dict = {
-                        'customer_id': conversation["context"].customer_id,
-                        'passenger_name': conversation["context"].passenger_name,
-                        'account_number': conversation["context"].account_number,
-                        'customer_email': conversation["context"].customer_email,
-                        'is_conference_attendee': conversation["context"].is_conference_attendee,
-                        'conference_name': conversation["context"].conference_name,
-                        'user_company_name': conversation["context"].user_company_name,
-                        'user_location': conversation["context"].user_location,
-                        'user_registration_id': conversation["context"].user_registration_id,
-                        'user_conference_package': conversation["context"].user_conference_package,
-                        'user_primary_stream': conversation["context"].user_primary_stream,
-                        'user_secondary_stream': conversation["context"].user_secondary_stream
-                    }
-                    response = await execute_networking_agent(request.message, context_dict)
-                except Exception as e:
-                    logger.error(f"Error executing agent {agent_name}: {e}")
-                    response = "I'm having trouble processing your request. Please try again or rephrase your question."
-                    
-            else:
-                agent_name = "Triage Agent"
-                if 'hello' in message_lower or 'hi' in message_lower:
-                    user_name = conversation["context"].passenger_name or "there"
-                    response = f"Hello {user_name}! 👋 Welcome to Business Conference 2025!\n\nI'm your conference assistant and I'm here to help you with:\n\n🗓️ **Conference Schedule** - Find sessions, speakers, timings, and rooms\n🤝 **Networking** - Connect with attendees and explore business opportunities\n\nWhat would you like to know about the conference today?"
-                else:
-                    response = f"I'm your conference assistant for Business Conference 2025. I can help you with:\n\n🗓️ **Conference Schedule** - Find sessions, speakers, timings, and rooms\n🤝 **Networking** - Connect with attendees and explore business opportunities\n\nWhat would you like to know about the conference?"
-            
+        
+            # Routing lives in main.route_and_execute, next to the agents;
+            # the cached context snapshot is passed straight through
+            agent_name, response = await route_and_execute(
+                request.message, conversation["context_dict"]
+            )
+
             conversation["messages"].append({
                 "content": response,
                 "agent": agent_name
             })
-            
-            conversation["current_agent"] = agent_name
-        
-        # Prepare customer info
-        customer_info = None
-        if conversation["context"].customer_id:
-            customer_info = {
-                "customer": {
-                    "name": conversation["context"].passenger_name,
-                    "account_number": conversation["context"].account_number,
-                    "email": conversation["context"].customer_email,
-                    "is_conference_attendee": conversation["context"].is_conference_attendee,
-                    "conference_name": conversation["context"].conference_name,
-                    "registration_id": conversation["context"].user_registration_id,
-                    "company": conversation["context"].user_company_name,
-                    "location": conversation["context"].user_location,
-                    "conference_package": conversation["context"].user_conference_package,
-                    "primary_stream": conversation["context"].user_primary_stream,
-                    "secondary_stream": conversation["context"].user_secondary_stream
-                },
-                "bookings": []
-            }
-        
-        # Prepare response
-        response = ChatResponse(
-            conversation_id=conversation["id"],
-            current_agent=conversation["current_agent"],
-            messages=conversation["messages"][-2:] if len(conversation["messages"]) >= 2 else conversation["messages"],
-            events=conversation.get("events", []),
-            context=conversation["context"].model_dump() if hasattr(conversation["context"], 'model_dump') else conversation["context"].__dict__,
-            agents=[
-                {
-                    "name": "Triage Agent",
-                    "description": "Main conference assistant that routes requests",
-                    "handoffs": ["Schedule Agent", "Networking Agent"],
-                    "tools": [],
-                    "input_guardrails": []
-                },
-                {
-                    "name": "Schedule Agent", 
-                    "description": "Conference schedule and session information",
-                    "handoffs": ["Triage Agent"],
-                    "tools": ["get_conference_schedule"],
-                    "input_guardrails": []
-                },
-                {
-                    "name": "Networking Agent",
-                    "description": "Networking, attendees, and business connections", 
-                    "handoffs": ["Triage Agent"],
-                    "tools": ["search_attendees", "search_businesses", "add_business", "display_business_form"],
-                    "input_guardrails": []
-                }
-            ],
-            guardrails=[],
-            customer_info=customer_info
-        )
         
-        return response
-        
-    except Exception as e:
-        logger.error(f"Error in chat endpoint: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+            conversation["current_agent"] = agent_name
+    
+        # Prepare response; a plain dict serialized by orjson skips Pydantic
+        # re-validation of the outgoing payload. customer_info is rebuilt by
+        # refresh_context_snapshot whenever the context changes.
+        return {
+            "conversation_id": conversation["id"],
+            "current_agent": conversation["current_agent"],
+            "messages": list(conversation["messages"])[-2:],
+            "events": list(conversation["events"]),
+            "context": conversation["context_dict"],
+            "agents": _AGENTS_METADATA,
+            "guardrails": [],
+            "customer_info": conversation["customer_info"]
+        }
+
+@app.post("/chat")
+async def chat_endpoint(request: ChatRequest):
+    """Main chat endpoint for conference assistant."""
+    return await _process_chat(request)
+
+@app.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """Streaming variant of /chat using Server-Sent Events.
+
+    Emits the assistant reply as a `message` event as soon as it is ready,
+    followed by a `done` event carrying the full response payload, so the
+    client can render the reply without waiting for the metadata.
+    """
+    payload = await _process_chat(request)
+
+    async def event_stream():
+        if payload["messages"]:
+            reply = payload["messages"][-1]
+            yield b"event: message\ndata: " + orjson.dumps(reply) + b"\n\n"
+        yield b"event: done\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 @app.get("/")
 async def root():
@@ -2,6 +2,7 @@
 
 from __future__ import annotations as _annotations
 
+import os
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
 
@@ -16,10 +17,25 @@ from agents import (
 )
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 
+# Model is env-tunable; defaults to Groq's fast llama-3.1-8b-instant, which
+# handles the light routing/tool-selection work these agents do with much
+# lower latency than the deprecated llama3-8b-8192.
+CONFERENCE_AGENT_MODEL = os.getenv("CONFERENCE_AGENT_MODEL", "groq/llama-3.1-8b-instant")
+
 # =========================
 # TOOLS (Conference-specific)
 # =========================
 
+# Optional attendee detail fields and their display labels; driving the
+# formatting loop off one tuple keeps the hot loop to a single get per field.
+_ATTENDEE_FIELDS = (
+    ('company', 'Company'),
+    ('location', 'Location'),
+    ('primary_stream', 'Primary Stream'),
+    ('secondary_stream', 'Secondary Stream'),
+    ('conference_package', 'Conference Package')
+)
+
 @function_tool(
     name_override="get_conference_schedule",
     description_override="Get conference schedule information by speaker, topic, room, track, or date."
@@ -43,7 +59,7 @@ async def get_conference_schedule_tool(
                 return f"Invalid date format: {conference_date}. Please use YYYY-MM-DD format."
 
         # Get schedule from database
-        schedule = await db_client.get_conference_schedule(
+        schedule, total = await db_client.get_conference_schedule(
             speaker_name=speaker_name,
             topic=topic,
             conference_room_name=conference_room_name,
@@ -52,42 +68,44 @@ async def get_conference_schedule_tool(
         )
 
         if not schedule:
-            filters = []
-            if speaker_name: filters.append(f"speaker '{speaker_name}'")
-            if topic: filters.append(f"topic '{topic}'")
-            if conference_room_name: filters.append(f"room '{conference_room_name}'")
-            if track_name: filters.append(f"track '{track_name}'")
-            if conference_date: filters.append(f"date '{conference_date}'")
-            
-            filter_text = " and ".join(filters) if filters else "your criteria"
+            filter_text = " and ".join(
+                f"{label} '{value}'"
+                for label, value in (
+                    ("speaker", speaker_name), ("topic", topic),
+                    ("room", conference_room_name), ("track", track_name),
+                    ("date", conference_date)
+                )
+                if value
+            ) or "your criteria"
             return f"No conference sessions found for {filter_text}."
 
-        # Format the schedule information
-        result = f"Found {len(schedule)} conference session(s):\n\n"
-        
+        # Format the schedule information; append fragments and join once
+        # instead of reallocating the string on every +=
+        parts = [f"Found {total} conference session(s):\n\n"]
+
         for session in schedule:
             start_time = session.get('start_time', 'TBD')
             end_time = session.get('end_time', 'TBD')
-            
+
             # Format datetime strings if they exist
             if isinstance(start_time, str) and 'T' in start_time:
                 start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00')).strftime('%I:%M %p')
             if isinstance(end_time, str) and 'T' in end_time:
                 end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00')).strftime('%I:%M %p')
-            
-            result += f"**{session.get('topic', 'Unknown Topic')}**\n"
-            result += f"Speaker: {session.get('speaker_name', 'TBD')}\n"
-            result += f"Time: {start_time} - {end_time}\n"
-            result += f"Room: {session.get('conference_room_name', 'TBD')}\n"
-            result += f"Track: {session.get('track_name', 'TBD')}\n"
-            result += f"Date: {session.get('conference_date', 'TBD')}\n"
-            
+
+            parts.append(f"**{session.get('topic', 'Unknown Topic')}**\n")
+            parts.append(f"Speaker: {session.get('speaker_name', 'TBD')}\n")
+            parts.append(f"Time: {start_time} - {end_time}\n")
+            parts.append(f"Room: {session.get('conference_room_name', 'TBD')}\n")
+            parts.append(f"Track: {session.get('track_name', 'TBD')}\n")
+            parts.append(f"Date: {session.get('conference_date', 'TBD')}\n")
+
             if session.get('description'):
-                result += f"Description: {session.get('description')}\n"
-            
-            result += "\n"
+                parts.append(f"Description: {session.get('description')}\n")
+
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Error retrieving conference schedule: {str(e)}"
@@ -115,28 +133,22 @@ async def search_attendees_tool(
             return f"No attendees found {search_text}."
 
         # Format attendee information
-        result = f"Found {len(attendees)} attendee(s):\n\n"
-        
+        parts = [f"Found {len(attendees)} attendee(s):\n\n"]
+
         for attendee in attendees:
             details = attendee.get('details', {})
             user_name = details.get('user_name') or f"{details.get('firstName', '')} {details.get('lastName', '')}".strip()
-            
-            result += f"**{user_name}**\n"
-            
-            if details.get('company'):
-                result += f"Company: {details.get('company')}\n"
-            if details.get('location'):
-                result += f"Location: {details.get('location')}\n"
-            if details.get('primary_stream'):
-                result += f"Primary Stream: {details.get('primary_stream')}\n"
-            if details.get('secondary_stream'):
-                result += f"Secondary Stream: {details.get('secondary_stream')}\n"
-            if details.get('conference_package'):
-                result += f"Conference Package: {details.get('conference_package')}\n"
-            
-            result += "\n"
-
-        return result
+
+            parts.append(f"**{user_name}**\n")
+
+            for key, label in _ATTENDEE_FIELDS:
+                value = details.get(key)
+                if value:
+                    parts.append(f"{label}: {value}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
 
     except Exception as e:
         return f"Error searching attendees: {str(e)}"
@@ -160,38 +172,37 @@ async def search_businesses_tool(
         )
 
         if not businesses:
-            filters = []
-            if query: filters.append(f"query '{query}'")
-            if sector: filters.append(f"sector '{sector}'")
-            if location: filters.append(f"location '{location}'")
-            
-            filter_text = " and ".join(filters) if filters else "your criteria"
+            filter_text = " and ".join(
+                f"{label} '{value}'"
+                for label, value in (("query", query), ("sector", sector), ("location", location))
+                if value
+            ) or "your criteria"
             return f"No businesses found for {filter_text}."
 
         # Format business information
-        result = f"Found {len(businesses)} business(es):\n\n"
-        
+        parts = [f"Found {len(businesses)} business(es):\n\n"]
+
         for business in businesses:
             details = business.get('details', {})
-            
-            result += f"**{details.get('companyName', 'Unknown Company')}**\n"
-            
+
+            parts.append(f"**{details.get('companyName', 'Unknown Company')}**\n")
+
             if details.get('industrySector'):
-                result += f"Industry: {details.get('industrySector')}\n"
+                parts.append(f"Industry: {details.get('industrySector')}\n")
             if details.get('subSector'):
-                result += f"Sub-sector: {details.get('subSector')}\n"
+                parts.append(f"Sub-sector: {details.get('subSector')}\n")
             if details.get('location'):
-                result += f"Location: {details.get('location')}\n"
+                parts.append(f"Location: {details.get('location')}\n")
             if details.get('briefDescription'):
-                result += f"Description: {details.get('briefDescription')}\n"
+                parts.append(f"Description: {details.get('briefDescription')}\n")
             if details.get('productsOrServices'):
-                result += f"Products/Services: {details.get('productsOrServices')}\n"
+                parts.append(f"Products/Services: {details.get('productsOrServices')}\n")
             if details.get('web'):
-                result += f"Website: {details.get('web')}\n"
-            
-            result += "\n"
+                parts.append(f"Website: {details.get('web')}\n")
 
-        return result
+            parts.append("\n")
+
+        return "".join(parts)
 
     except Exception as e:
         return f"Error searching businesses: {str(e)}"
@@ -225,29 +236,29 @@ async def get_user_businesses_tool(
             return f"No businesses found for {user_text}."
 
         # Format business information
-        result = f"Found {len(businesses)} business(es) for {user_name or 'the current user'}:\n\n"
-        
+        parts = [f"Found {len(businesses)} business(es) for {user_name or 'the current user'}:\n\n"]
+
         for business in businesses:
             details = business.get('details', {})
-            
-            result += f"**{details.get('companyName', 'Unknown Company')}**\n"
-            
+
+            parts.append(f"**{details.get('companyName', 'Unknown Company')}**\n")
+
             if details.get('industrySector'):
-                result += f"Industry: {details.get('industrySector')}\n"
+                parts.append(f"Industry: {details.get('industrySector')}\n")
             if details.get('subSector'):
-                result += f"Sub-sector: {details.get('subSector')}\n"
+                parts.append(f"Sub-sector: {details.get('subSector')}\n")
             if details.get('location'):
-                result += f"Location: {details.get('location')}\n"
+                parts.append(f"Location: {details.get('location')}\n")
             if details.get('positionTitle'):
-                result += f"Position: {details.get('positionTitle')}\n"
+                parts.append(f"Position: {details.get('positionTitle')}\n")
             if details.get('briefDescription'):
-                result += f"Description: {details.get('briefDescription')}\n"
+                parts.append(f"Description: {details.get('briefDescription')}\n")
             if details.get('web'):
-                result += f"Website: {details.get('web')}\n"
-            
-            result += "\n"
+                parts.append(f"Website: {details.get('web')}\n")
+
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Error retrieving user businesses: {str(e)}"
@@ -334,16 +345,18 @@ async def get_organization_info_tool(
             return f"No organization found with ID '{organization_id}'."
 
         # Format organization information
-        result = f"**Organization Information**\n\n"
-        result += f"Name: {organization.get('name', 'Unknown')}\n"
-        
+        parts = [
+            "**Organization Information**\n\n",
+            f"Name: {organization.get('name', 'Unknown')}\n"
+        ]
+
         details = organization.get('details', {})
         if details:
             for key, value in details.items():
                 if value:
-                    result += f"{key.replace('_', ' ').title()}: {value}\n"
+                    parts.append(f"{key.replace('_', ' ').title()}: {value}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Error retrieving organization information: {str(e)}"
@@ -352,63 +365,72 @@ async def get_organization_info_tool(
 # AGENTS (Conference-specific)
 # =========================
 
+# Instruction bodies are static apart from the user name, so each body is
+# concatenated once at import and every call is a single substitution.
+# Only the locally-owned body goes through .format — the SDK-owned prefix
+# is prepended untouched so literal braces in a future SDK version can't
+# break the substitution.
+_SCHEDULE_AGENT_BODY = (
+    "You are a Conference Schedule Agent. Help attendees find information about conference sessions, speakers, and schedules.\n"
+    "Current user: {user_name}\n"
+    "You can help with:\n"
+    "1. Finding sessions by speaker name, topic, room, track, or date\n"
+    "2. Getting schedule information for specific time periods\n"
+    "3. Providing details about conference rooms and tracks\n"
+    "4. Answering questions about session timings and descriptions\n\n"
+    "Use the get_conference_schedule tool to search for sessions. **Do not describe tool usage in your responses.**\n"
+    "If the user asks unrelated questions, transfer back to the triage agent."
+)
+
 def schedule_agent_instructions(
     run_context: RunContextWrapper[AirlineAgentContext], agent: Agent[AirlineAgentContext]
 ) -> str:
     ctx = run_context.context
-    user_name = ctx.passenger_name or "[unknown]"
-    return (
-        f"{RECOMMENDED_PROMPT_PREFIX}\n"
-        "You are a Conference Schedule Agent. Help attendees find information about conference sessions, speakers, and schedules.\n"
-        f"Current user: {user_name}\n"
-        "You can help with:\n"
-        "1. Finding sessions by speaker name, topic, room, track, or date\n"
-        "2. Getting schedule information for specific time periods\n"
-        "3. Providing details about conference rooms and tracks\n"
-        "4. Answering questions about session timings and descriptions\n\n"
-        "Use the get_conference_schedule tool to search for sessions. **Do not describe tool usage in your responses.**\n"
-        "If the user asks unrelated questions, transfer back to the triage agent."
+    return RECOMMENDED_PROMPT_PREFIX + "\n" + _SCHEDULE_AGENT_BODY.format(
+        user_name=ctx.passenger_name or "[unknown]"
     )
 
 schedule_agent = Agent[AirlineAgentContext](
     name="Schedule Agent",
-    model="groq/llama3-8b-8192",
+    model=CONFERENCE_AGENT_MODEL,
     handoff_description="An agent to provide conference schedule information and help find sessions.",
     instructions=schedule_agent_instructions,
     tools=[get_conference_schedule_tool],
     handoffs=[],
 )
 
+_NETWORKING_AGENT_BODY = (
+    "You are a Networking Agent. Help attendees connect with other participants and explore business opportunities.\n"
+    "Current user: {user_name}\n"
+    "You can help with:\n"
+    "1. Finding other conference attendees by name or interests\n"
+    "2. Searching for businesses by company name, industry sector, or location\n"
+    "3. Getting information about specific users' businesses\n"
+    "4. Helping users register their own businesses\n"
+    "5. Providing organization information\n\n"
+    "Available tools:\n"
+    "- search_attendees: Find conference attendees\n"
+    "- search_businesses: Find businesses by various criteria\n"
+    "- get_user_businesses: Get businesses for a specific user\n"
+    "- display_business_form: Show business registration form\n"
+    "- add_business: Add a new business (used automatically when user submits form)\n"
+    "- get_organization_info: Get organization details\n\n"
+    "**Do not describe tool usage in your responses.**\n"
+    "If the user wants to add a business, use display_business_form to show them the registration form.\n"
+    "If the user asks unrelated questions, transfer back to the triage agent."
+)
+
 def networking_agent_instructions(
     run_context: RunContextWrapper[AirlineAgentContext], agent: Agent[AirlineAgentContext]
 ) -> str:
     ctx = run_context.context
-    user_name = ctx.passenger_name or "[unknown]"
-    return (
-        f"{RECOMMENDED_PROMPT_PREFIX}\n"
-        "You are a Networking Agent. Help attendees connect with other participants and explore business opportunities.\n"
-        f"Current user: {user_name}\n"
-        "You can help with:\n"
-        "1. Finding other conference attendees by name or interests\n"
-        "2. Searching for businesses by company name, industry sector, or location\n"
-        "3. Getting information about specific users' businesses\n"
-        "4. Helping users register their own businesses\n"
-        "5. Providing organization information\n\n"
-        "Available tools:\n"
-        "- search_attendees: Find conference attendees\n"
-        "- search_businesses: Find businesses by various criteria\n"
-        "- get_user_businesses: Get businesses for a specific user\n"
-        "- display_business_form: Show business registration form\n"
-        "- add_business: Add a new business (used automatically when user submits form)\n"
-        "- get_organization_info: Get organization details\n\n"
-        "**Do not describe tool usage in your responses.**\n"
-        "If the user wants to add a business, use display_business_form to show them the registration form.\n"
-        "If the user asks unrelated questions, transfer back to the triage agent."
+    return RECOMMENDED_PROMPT_PREFIX + "\n" + _NETWORKING_AGENT_BODY.format(
+        user_name=ctx.passenger_name or "[unknown]"
     )
 
 networking_agent = Agent[AirlineAgentContext](
     name="Networking Agent",
-    model="groq/llama3-8b-8192",
+    model=CONFERENCE_AGENT_MODEL,
     handoff_description="An agent to help with networking, finding attendees, and business connections.",
     instructions=networking_agent_instructions,
     tools=[
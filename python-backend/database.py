@@ -388,12 +388,24 @@
 
 import os
 from supabase import create_client, Client
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 from datetime import datetime, date
 
 logger = logging.getLogger(__name__)
 
+def _fmt_iso_time(value: str) -> str:
+    """Format the time portion of an ISO timestamp as e.g. '02:30 PM'.
+
+    Slices 'HH:MM' straight out of the string instead of building a full
+    datetime via fromisoformat + strftime; schedule rows go through this
+    twice each, so the hot path stays allocation-free.
+    """
+    i = value.find('T')
+    hh = int(value[i + 1:i + 3])
+    mm = value[i + 4:i + 6]
+    return f"{(hh - 1) % 12 + 1:02d}:{mm} {'AM' if hh < 12 else 'PM'}"
+
 class SupabaseClient:
     def __init__(self):
         url = os.getenv("SUPABASE_URL")
@@ -517,6 +529,23 @@ class SupabaseClient:
             logger.error(f"Error fetching user with QR code {qr_code}: {e}", exc_info=True)
             return None
 
+    async def get_user_by_identifier(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """Get user details by registration ID, falling back to QR code (user ID).
+
+        The underlying supabase client is synchronous, so gathering the two
+        lookups would just run both queries back-to-back on every call;
+        trying registration id first keeps the common hit to one query and
+        only pays for the QR lookup on a miss.
+        """
+        try:
+            user = await self.get_user_by_registration_id(identifier)
+            if user:
+                return user
+            return await self.get_user_by_qr_code(identifier)
+        except Exception as e:
+            logger.error(f"Error fetching user with identifier {identifier}: {e}", exc_info=True)
+            return None
+
     # Keep the old customer method for backward compatibility (used by airline agents backup)
     async def get_customer_by_account_number(self, account_number: str) -> Optional[Dict[str, Any]]:
         """Get customer details by account number, including conference info."""
@@ -793,6 +822,58 @@ class SupabaseClient:
             logger.error(f"Error fetching bookings for customer ID {customer_id}: {e}", exc_info=True)
             return []
 
+    async def list_all_users(self) -> List[Dict[str, Any]]:
+        """Fetch every user in one bulk select, normalized like the lookups above.
+
+        Used to prewarm the in-process user cache at startup: for a fixed
+        conference attendee set, one sequential scan replaces per-request
+        point lookups.
+        """
+        try:
+            response = self.supabase.table("users").select("*").execute()
+
+            normalized_users = []
+            for user in response.data or []:
+                details = user.get("details", {})
+                registration_id = details.get("registration_id")
+
+                normalized_users.append({
+                    "id": user.get("id"),
+                    "name": details.get("user_name") or f"{details.get('firstName', '')} {details.get('lastName', '')}".strip(),
+                    "account_number": str(registration_id) if registration_id else user.get("id"),
+                    "email": details.get("registered_email") or details.get("email"),
+                    "is_conference_attendee": True,  # All users in this table are conference attendees
+                    "conference_name": "Business Conference 2025",  # Default conference name
+                    "registration_id": registration_id,
+                    "mobile": details.get("mobile"),
+                    "whatsapp_number": details.get("whatsapp_number"),
+                    "company": details.get("company"),
+                    "location": details.get("location"),
+                    "address": details.get("address"),
+                    "conference_package": details.get("conference_package"),
+                    "membership_type": details.get("membership_type"),
+                    "primary_stream": details.get("primary_stream"),
+                    "secondary_stream": details.get("secondary_stream"),
+                    "food_preference": details.get("food"),
+                    "room_preference": details.get("room"),
+                    "kovil": details.get("kovil"),
+                    "native": details.get("native"),
+                    "gender": details.get("gender"),
+                    "title": details.get("title"),
+                    "organization_id": user.get("organization_id"),
+                    "role_id": user.get("role_id"),
+                    "role_type": user.get("role_type"),
+                    "is_active": user.get("is_active", True),
+                    "created_at": user.get("created_at"),
+                    "updated_at": user.get("updated_at")
+                })
+
+            logger.debug(f"Fetched {len(normalized_users)} users in bulk.")
+            return normalized_users
+        except Exception as e:
+            logger.error(f"Error listing all users: {e}", exc_info=True)
+            return []
+
     async def get_conference_schedule(
         self,
         speaker_name: Optional[str] = None,
@@ -801,14 +882,21 @@ class SupabaseClient:
         track_name: Optional[str] = None,
         conference_date: Optional[date] = None,
         time_range_start: Optional[datetime] = None,
-        time_range_end: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
+        time_range_end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Fetches conference schedule based on various filters.
         Converts date objects to ISO format strings for Supabase query.
+        Each returned row also carries pre-formatted 'start_time_str' /
+        'end_time_str' display times so callers never re-parse timestamps.
+
+        Returns (rows, total): 'limit' caps the rows transferred while the
+        exact pre-limit match count comes back in the same response, so
+        callers can report the true total without fetching every row.
         """
         try:
-            query = self.supabase.table("conference_schedules").select("*")
+            query = self.supabase.table("conference_schedules").select("*", count="exact")
 
             if speaker_name:
                 query = query.ilike("speaker_name", f"%{speaker_name}%")
@@ -825,16 +913,37 @@ class SupabaseClient:
             if time_range_end:
                 query = query.lte("end_time", time_range_end.isoformat()) # Convert datetime to ISO string
 
-            response = query.order("start_time").execute() # Order by time for better readability
-            
-            if response.data:
-                logger.debug(f"Found {len(response.data)} conference sessions.")
+            query = query.order("start_time") # Order by time for better readability
+            if limit is not None:
+                query = query.limit(limit)
+
+            response = query.execute()
+
+            rows = response.data or []
+            total = response.count if response.count is not None else len(rows)
+            if rows:
+                logger.debug(f"Found {total} conference sessions ({len(rows)} fetched).")
             else:
                 logger.debug("No conference sessions found for the given criteria.")
-            return response.data or []
+            return self._attach_display_times(rows), total
         except Exception as e:
             logger.error(f"Error fetching conference schedule: {e}", exc_info=True)
-            return []
+            return [], 0
+
+    @staticmethod
+    def _attach_display_times(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add 'start_time_str'/'end_time_str' display times to schedule rows.
+
+        Parsing the ISO timestamps once here, right after the fetch, keeps
+        datetime parsing out of every formatting loop downstream.
+        """
+        for row in rows:
+            for src, dst in (("start_time", "start_time_str"), ("end_time", "end_time_str")):
+                value = row.get(src, 'TBD')
+                if isinstance(value, str) and 'T' in value:
+                    value = _fmt_iso_time(value)
+                row[dst] = value
+        return rows
 
     async def get_customer_bookings(self, account_number: str) -> List[Dict[str, Any]]:
         """
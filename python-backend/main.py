@@ -3,50 +3,70 @@
 from __future__ import annotations as _annotations
 
 import os
+import sys
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from collections import defaultdict, deque
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime, date
 import uuid
 import re
 
+from cachetools import LRUCache, TTLCache
+
 # Import shared context type from shared_types.py
 from shared_types import AirlineAgentContext
 from database import db_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging only when the application hasn't already done so;
+# this module is imported as a library by api.py (and twice under uvicorn
+# reload), where an unconditional basicConfig would duplicate handlers.
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # =========================
 # HELPER FUNCTIONS
 # =========================
 
+# Date alternations and "events on [date]" patterns, compiled once at import
+# so the hot path never re-parses pattern literals. Each alternation replaces
+# three substring scans; "july 1" uses a word boundary so it cannot swallow
+# "july 15"/"july 16".
+_JULY_15_RE = re.compile(r"july\s+15(?:th)?|15th\s+july")
+_JULY_16_RE = re.compile(r"july\s+16(?:th)?|16th\s+july")
+_JULY_1_RE = re.compile(r"july\s+1(?:st)?\b|1st\s+july")
+_SEPTEMBER_RE = re.compile(r"\bseptember\b")
+_DATE_PATTERNS = (
+    re.compile(r"events?\s+on\s+(\w+\s+\d+)"),
+    re.compile(r"sessions?\s+on\s+(\w+\s+\d+)"),
+    re.compile(r"speakers?\s+on\s+(\w+\s+\d+)"),
+    re.compile(r"(\w+\s+\d+(?:st|nd|rd|th)?)")
+)
+
+# The extractors below are pure functions of the message text, so repeated
+# messages (frontend retries, several users asking the stock questions) are
+# answered from an lru_cache hit instead of re-scanning the string.
+@lru_cache(maxsize=1024)
 def parse_date_from_message(message: str) -> Optional[str]:
     """Parse date from natural language message."""
     message_lower = message.lower()
-    
+
     # Handle specific date formats
-    if "july 15" in message_lower or "15th july" in message_lower or "july 15th" in message_lower:
+    if _JULY_15_RE.search(message_lower):
         return "2025-07-15"
-    elif "july 16" in message_lower or "16th july" in message_lower or "july 16th" in message_lower:
+    elif _JULY_16_RE.search(message_lower):
         return "2025-07-16"
-    elif "july 1" in message_lower or "1st july" in message_lower or "july 1st" in message_lower:
+    elif _JULY_1_RE.search(message_lower):
         return None  # No data for July 1st
-    elif "september 1" in message_lower or "1st september" in message_lower or "september 1st" in message_lower:
-        return "2025-09-01"
-    elif "september" in message_lower:
-        return "2025-09-01"  # Default to September 1st if just "september" is mentioned
-    
+    elif _SEPTEMBER_RE.search(message_lower):
+        return "2025-09-01"  # All September queries default to September 1st
+
     # Handle "events on [date]" pattern
-    date_patterns = [
-        r"events?\s+on\s+(\w+\s+\d+)",
-        r"sessions?\s+on\s+(\w+\s+\d+)",
-        r"speakers?\s+on\s+(\w+\s+\d+)",
-        r"(\w+\s+\d+(?:st|nd|rd|th)?)"
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, message_lower)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(message_lower)
         if match:
             date_str = match.group(1)
             # Try to parse common date formats
@@ -58,119 +78,163 @@ def parse_date_from_message(message: str) -> Optional[str]:
                 return None  # No data for July 1st
             elif "september 1" in date_str:
                 return "2025-09-01"
-    
+
     return None
 
+# Common speaker names from the database. Inverted once at import into a
+# token -> canonical-name index (the full lowercased name plus every name
+# part longer than 3 chars), so extraction costs a handful of hash lookups
+# instead of ~70 substring scans that re-split every name per call.
+_SPEAKERS = (
+    "Alice Wonderland", "Bob The Builder", "Charlie Chaplin", "Diana Prince",
+    "Eve Harrington", "Frank Sinatra", "Grace Hopper", "Harry Potter",
+    "Ivy League", "Jack Sparrow", "Karen Carpenter", "Liam Neeson",
+    "Mia Wallace", "Noah Wyle", "Olivia Newton", "Peter Pan",
+    "Quinn Fabray", "Rachel Green", "Samwise Gamgee", "Tina Turner",
+    "Ulysses S. Grant", "Victor Von Doom", "Wendy Darling", "Xavier Riddle",
+    "Yara Greyjoy", "Zoe Washburne", "Adam Sandler", "Betty Boop",
+    "Cathy Lane", "David Bowie", "Elsa Frozen", "Fred Flintstone",
+    "George Jetson", "Hannah Montana", "Indiana Jones", "Julia Child",
+    "Kevin Hart", "Leia Organa", "Morpheus Neo", "Nemo Fish",
+    "Oprah Winfrey", "Popeye Sailor", "Queen Elizabeth", "Ron Weasley",
+    "Sherlock Holmes", "Tony Stark", "Uma Thurman", "Vincent Van Gogh",
+    "Walter White", "Yoda Jedi", "Zelda Princess", "Anakin Skywalker",
+    "Bruce Wayne", "Clark Kent", "Darth Vader", "Eliza Doolittle",
+    "Frodo Baggins", "Gollum Precious", "Hermione Granger", "Iron Man",
+    "Jasmine Princess", "King Arthur", "Loki Mischief", "Mickey Mouse",
+    "Nancy Drew", "Olaf Snowman", "Pocahontas", "Quentin Tarantino",
+    "Rocky Balboa", "Snow White", "Tom Cruise", "Ursula Sea"
+)
+
+_SPEAKER_INDEX: Dict[str, str] = {}
+for _speaker in _SPEAKERS:
+    _name_lower = _speaker.lower()
+    # setdefault keeps list order authoritative when a part is shared
+    # between speakers (e.g. "princess"), matching the old scan order
+    _canonical = sys.intern(_speaker)
+    _SPEAKER_INDEX.setdefault(_name_lower, _canonical)
+    for _part in _name_lower.split():
+        if len(_part) > 3:
+            _SPEAKER_INDEX.setdefault(_part, _canonical)
+
+_NAME_TOKEN_RE = re.compile(r"[a-z]+")
+
+@lru_cache(maxsize=1024)
 def extract_speaker_from_message(message: str) -> Optional[str]:
     """Extract speaker name from message."""
     message_lower = message.lower()
-    
-    # Common speaker names from the database - check for partial matches
-    speakers = [
-        "Alice Wonderland", "Bob The Builder", "Charlie Chaplin", "Diana Prince",
-        "Eve Harrington", "Frank Sinatra", "Grace Hopper", "Harry Potter",
-        "Ivy League", "Jack Sparrow", "Karen Carpenter", "Liam Neeson",
-        "Mia Wallace", "Noah Wyle", "Olivia Newton", "Peter Pan",
-        "Quinn Fabray", "Rachel Green", "Samwise Gamgee", "Tina Turner",
-        "Ulysses S. Grant", "Victor Von Doom", "Wendy Darling", "Xavier Riddle",
-        "Yara Greyjoy", "Zoe Washburne", "Adam Sandler", "Betty Boop",
-        "Cathy Lane", "David Bowie", "Elsa Frozen", "Fred Flintstone",
-        "George Jetson", "Hannah Montana", "Indiana Jones", "Julia Child",
-        "Kevin Hart", "Leia Organa", "Morpheus Neo", "Nemo Fish",
-        "Oprah Winfrey", "Popeye Sailor", "Queen Elizabeth", "Ron Weasley",
-        "Sherlock Holmes", "Tony Stark", "Uma Thurman", "Vincent Van Gogh",
-        "Walter White", "Yoda Jedi", "Zelda Princess", "Anakin Skywalker",
-        "Bruce Wayne", "Clark Kent", "Darth Vader", "Eliza Doolittle",
-        "Frodo Baggins", "Gollum Precious", "Hermione Granger", "Iron Man",
-        "Jasmine Princess", "King Arthur", "Loki Mischief", "Mickey Mouse",
-        "Nancy Drew", "Olaf Snowman", "Pocahontas", "Quentin Tarantino",
-        "Rocky Balboa", "Snow White", "Tom Cruise", "Ursula Sea"
-    ]
-    
-    for speaker in speakers:
-        # Check for full name or partial matches
-        speaker_parts = speaker.lower().split()
-        if speaker.lower() in message_lower:
-            return speaker
-        # Check for first name or last name matches
-        elif any(part in message_lower for part in speaker_parts if len(part) > 3):
+
+    # Exact full-name message first, then token-by-token lookups
+    speaker = _SPEAKER_INDEX.get(message_lower)
+    if speaker:
+        return speaker
+
+    for token in _NAME_TOKEN_RE.findall(message_lower):
+        speaker = _SPEAKER_INDEX.get(token)
+        if speaker:
             return speaker
-    
+
     return None
 
+# Track and room keyword tables, inverted once at import into a single
+# keyword -> (slot, canonical value) map and compiled into one alternation.
+# One C-level scan over the message then fills every slot, instead of a
+# nested "any(kw in message)" loop per track and per room.
+_TRACK_KEYWORDS = {
+    "AI & ML": ["ai", "ml", "machine learning", "artificial intelligence", "ai & ml"],
+    "Cloud Computing": ["cloud", "computing", "cloud computing"],
+    "Data Science": ["data science", "data", "analytics"],
+    "Web Development": ["web", "development", "frontend", "backend", "web development"],
+    "Cybersecurity": ["cyber", "security", "cybersecurity"],
+    "Product Management": ["product", "management", "product management"],
+    "Startup & Entrepreneurship": ["startup", "entrepreneur", "entrepreneurship"]
+}
+_ROOM_KEYWORDS = {
+    "Grand Ballroom": ["grand ballroom", "ballroom"],
+    "Executive Suite 1": ["executive suite 1", "executive suite"],
+    "Executive Suite 2": ["executive suite 2"],
+    "Breakout Room A": ["breakout room a", "breakout a"],
+    "Breakout Room B": ["breakout room b", "breakout b"],
+    "Innovation Hub": ["innovation hub", "hub"],
+    "Networking Lounge": ["networking lounge", "lounge"]
+}
+
+# Canonical values are interned so every hit shares one string object —
+# they get stashed in contexts and message history thousands of times
+_KEYWORD_SLOTS: Dict[str, Tuple[str, str]] = {}
+for _track, _keywords in _TRACK_KEYWORDS.items():
+    for _kw in _keywords:
+        _KEYWORD_SLOTS[_kw] = ("track", sys.intern(_track))
+for _room, _keywords in _ROOM_KEYWORDS.items():
+    for _kw in _keywords:
+        _KEYWORD_SLOTS[_kw] = ("room", sys.intern(_room))
+
+# Longest alternative first so "ai & ml" beats "ai" at the same position
+_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, sorted(_KEYWORD_SLOTS, key=len, reverse=True)))
+)
+
+def scan_schedule_slots(message_lower: str) -> Dict[str, str]:
+    """Fill track/room slots from one pass over the lowercased message.
+
+    The first (leftmost, longest) keyword hit per slot wins.
+    """
+    slots: Dict[str, str] = {}
+    for match in _KEYWORD_RE.finditer(message_lower):
+        slot, value = _KEYWORD_SLOTS[match.group(0)]
+        slots.setdefault(slot, value)
+    return slots
+
+@lru_cache(maxsize=1024)
 def extract_track_from_message(message: str) -> Optional[str]:
     """Extract track name from message."""
-    message_lower = message.lower()
-    
-    track_keywords = {
-        "AI & ML": ["ai", "ml", "machine learning", "artificial intelligence", "ai & ml"],
-        "Cloud Computing": ["cloud", "computing", "cloud computing"],
-        "Data Science": ["data science", "data", "analytics"],
-        "Web Development": ["web", "development", "frontend", "backend", "web development"],
-        "Cybersecurity": ["cyber", "security", "cybersecurity"],
-        "Product Management": ["product", "management", "product management"],
-        "Startup & Entrepreneurship": ["startup", "entrepreneur", "entrepreneurship"]
-    }
-    
-    for track, keywords in track_keywords.items():
-        if any(keyword in message_lower for keyword in keywords):
-            return track
-    
-    return None
+    return scan_schedule_slots(message.lower()).get("track")
 
+@lru_cache(maxsize=1024)
 def extract_room_from_message(message: str) -> Optional[str]:
     """Extract room name from message."""
-    message_lower = message.lower()
-    
-    room_keywords = {
-        "Grand Ballroom": ["grand ballroom", "ballroom"],
-        "Executive Suite 1": ["executive suite 1", "executive suite"],
-        "Executive Suite 2": ["executive suite 2"],
-        "Breakout Room A": ["breakout room a", "breakout a"],
-        "Breakout Room B": ["breakout room b", "breakout b"],
-        "Innovation Hub": ["innovation hub", "hub"],
-        "Networking Lounge": ["networking lounge", "lounge"]
-    }
-    
-    for room, keywords in room_keywords.items():
-        if any(keyword in message_lower for keyword in keywords):
-            return room
-    
-    return None
+    return scan_schedule_slots(message.lower()).get("room")
+
+# "tell about [name]"-style capture patterns, compiled once at import
+_PERSON_EXCLUDE_WORDS = frozenset({
+    'speaker', 'speakers', 'attendee', 'attendees', 'business', 'businesses',
+    'company', 'companies', 'session', 'sessions', 'event', 'events'
+})
+_PERSON_PATTERNS = (
+    re.compile(r"tell\s+(?:me\s+)?about\s+([A-Za-z\s]+)"),
+    re.compile(r"about\s+([A-Za-z\s]+)"),
+    re.compile(r"find\s+([A-Za-z\s]+)"),
+    re.compile(r"show\s+(?:me\s+)?([A-Za-z\s]+)"),
+    re.compile(r"who\s+is\s+([A-Za-z\s]+)")
+)
 
 def extract_person_name_from_message(message: str) -> Optional[str]:
     """Extract person name from networking queries."""
     message_lower = message.lower()
-    
+
     # Look for patterns like "tell about [name]", "about [name]", "find [name]"
-    patterns = [
-        r"tell\s+(?:me\s+)?about\s+([A-Za-z\s]+)",
-        r"about\s+([A-Za-z\s]+)",
-        r"find\s+([A-Za-z\s]+)",
-        r"show\s+(?:me\s+)?([A-Za-z\s]+)",
-        r"who\s+is\s+([A-Za-z\s]+)"
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, message_lower)
+    for pattern in _PERSON_PATTERNS:
+        match = pattern.search(message_lower)
         if match:
             name = match.group(1).strip()
             # Filter out common words that aren't names
-            exclude_words = ['speaker', 'speakers', 'attendee', 'attendees', 'business', 'businesses', 
-                           'company', 'companies', 'session', 'sessions', 'event', 'events']
-            if name.lower() not in exclude_words and len(name) > 2:
+            if name.lower() not in _PERSON_EXCLUDE_WORDS and len(name) > 2:
                 return name.title()  # Capitalize properly
     
     return None
 
+# Words that turn a "speakers" query into a session-detail query rather
+# than a plain speaker list; two-to-three items, so a tuple scan is cheapest
+_SPEAKER_DETAIL_WORDS = ("session", "topic", "time")
+
 def determine_query_type(message: str) -> str:
     """Determine what type of information the user is asking for."""
     message_lower = message.lower()
-    
+
     # Check for specific query types
     if "rooms" in message_lower and "room" not in message_lower:
         return "rooms_list"
-    elif "speakers" in message_lower and not any(word in message_lower for word in ["session", "topic", "time"]):
+    elif "speakers" in message_lower and not any(word in message_lower for word in _SPEAKER_DETAIL_WORDS):
         return "speakers_list"
     elif "tracks" in message_lower:
         return "tracks_list"
@@ -185,100 +249,230 @@ def determine_query_type(message: str) -> str:
 # TOOL FUNCTIONS (Direct implementations)
 # =========================
 
+# (details key, display label) pairs for the optional lines of each reply.
+# A single loop with one .get per field replaces the per-field if-chains.
+_ATTENDEE_FIELDS = (
+    ('company', 'Company'),
+    ('location', 'Location'),
+    ('primary_stream', 'Primary Stream'),
+    ('secondary_stream', 'Secondary Stream'),
+    ('conference_package', 'Conference Package'),
+    ('email', 'Email'),
+    ('mobile', 'Mobile')
+)
+_BUSINESS_FIELDS = (
+    ('industrySector', 'Industry'),
+    ('subSector', 'Sub-sector'),
+    ('location', 'Location'),
+    ('briefDescription', 'Description'),
+    ('productsOrServices', 'Products/Services'),
+    ('web', 'Website')
+)
+_USER_BUSINESS_FIELDS = (
+    ('industrySector', 'Industry'),
+    ('subSector', 'Sub-sector'),
+    ('location', 'Location'),
+    ('positionTitle', 'Position'),
+    ('briefDescription', 'Description'),
+    ('productsOrServices', 'Products/Services'),
+    ('web', 'Website')
+)
+
+# The schedule is effectively static while the conference runs, so identical
+# filter combinations within the TTL window skip the DB round trip and the
+# formatting loop entirely.
+_schedule_cache: TTLCache = TTLCache(maxsize=256, ttl=int(os.getenv("SCHEDULE_CACHE_TTL", "60")))
+
+# One lock per filter tuple so a burst of identical schedule queries after a
+# TTL expiry fires a single DB fetch; the rest wait and read the fresh entry.
+_schedule_fetch_locks: Dict[tuple, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# The router only ever produces a handful of distinct dates, so the parse
+# result is memoized rather than re-run through strptime on every call.
+@lru_cache(maxsize=64)
+def _parse_ymd(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
 async def get_conference_schedule_tool(
     speaker_name: Optional[str] = None,
     topic: Optional[str] = None,
     conference_room_name: Optional[str] = None,
     track_name: Optional[str] = None,
     conference_date: Optional[str] = None,
-    query_type: str = "general"
-) -> str:
-    """Get conference schedule information based on various filters."""
-    try:
-        # Convert date string to date object if provided
-        parsed_date = None
-        if conference_date:
+    query_type: str = "general",
+    output_format: str = "markdown"
+) -> Union[str, Dict[str, Any]]:
+    """Get conference schedule information based on various filters.
+
+    output_format="markdown" (the default) returns the rendered reply
+    string; output_format="structured" returns {"total", "shown", "items"}
+    so callers like the API layer can serialize the records directly with
+    orjson instead of shipping pre-rendered markdown. Structured results
+    are cached too and must be treated as read-only.
+
+    Responses are cached per filter tuple for a short TTL; errors are never
+    cached so a transient DB failure does not stick around.
+    """
+    cache_key = (speaker_name, topic, conference_room_name, track_name, conference_date, query_type, output_format)
+    cached = _schedule_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    lock = _schedule_fetch_locks[cache_key]
+    async with lock:
+        # Re-check: another coroutine may have filled the cache while we waited
+        result = _schedule_cache.get(cache_key)
+        if result is None:
             try:
-                parsed_date = datetime.strptime(conference_date, "%Y-%m-%d").date()
-            except ValueError:
-                return f"Invalid date format: {conference_date}. Please use YYYY-MM-DD format."
+                result = await _build_schedule_reply(
+                    speaker_name, topic, conference_room_name, track_name,
+                    conference_date, query_type, output_format
+                )
+            except Exception as e:
+                logger.error("Error in get_conference_schedule_tool: %s", e)
+                return f"Error retrieving conference schedule: {str(e)}"
 
-        # Get schedule from database
-        schedule = await db_client.get_conference_schedule(
-            speaker_name=speaker_name,
-            topic=topic,
-            conference_room_name=conference_room_name,
-            track_name=track_name,
-            conference_date=parsed_date
-        )
+            _schedule_cache[cache_key] = result
 
-        if not schedule:
-            filters = []
-            if speaker_name: filters.append(f"speaker '{speaker_name}'")
-            if topic: filters.append(f"topic '{topic}'")
-            if conference_room_name: filters.append(f"room '{conference_room_name}'")
-            if track_name: filters.append(f"track '{track_name}'")
-            if conference_date: filters.append(f"date '{conference_date}'")
-            
-            filter_text = " and ".join(filters) if filters else "your criteria"
-            return f"No conference sessions found for {filter_text}."
-
-        # Handle different query types
-        if query_type == "rooms_list":
-            # Return unique room names
-            rooms = list(set(session.get('conference_room_name', 'Unknown') for session in schedule))
-            return f"Conference rooms available:\n\n" + "\n".join(f"• {room}" for room in sorted(rooms))
-        
-        elif query_type == "speakers_list":
-            # Return unique speaker names
-            speakers = list(set(session.get('speaker_name', 'Unknown') for session in schedule))
-            return f"Conference speakers:\n\n" + "\n".join(f"• {speaker}" for speaker in sorted(speakers))
-        
-        elif query_type == "tracks_list":
-            # Return unique track names
-            tracks = list(set(session.get('track_name', 'Unknown') for session in schedule))
-            return f"Conference tracks:\n\n" + "\n".join(f"• {track}" for track in sorted(tracks))
-
-        # For detailed session information, limit results
-        if len(schedule) > 5:
-            schedule = schedule[:5]
-            result = f"Found {len(schedule)} conference sessions (showing first 5):\n\n"
-        else:
-            result = f"Found {len(schedule)} conference session(s):\n\n"
-        
-        for session in schedule:
-            start_time = session.get('start_time', 'TBD')
-            end_time = session.get('end_time', 'TBD')
-            
-            # Format datetime strings if they exist
-            if isinstance(start_time, str) and 'T' in start_time:
-                start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00')).strftime('%I:%M %p')
-            if isinstance(end_time, str) and 'T' in end_time:
-                end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00')).strftime('%I:%M %p')
-            
-            result += f"**{session.get('topic', 'Unknown Topic')}**\n"
-            result += f"Speaker: {session.get('speaker_name', 'TBD')}\n"
-            result += f"Time: {start_time} - {end_time}\n"
-            result += f"Room: {session.get('conference_room_name', 'TBD')}\n"
-            result += f"Track: {session.get('track_name', 'TBD')}\n"
-            result += f"Date: {session.get('conference_date', 'TBD')}\n"
-            
-            if session.get('description'):
-                result += f"Description: {session.get('description')}\n"
-            
-            result += "\n"
+    # Drop idle locks so one-off filter combinations can't grow the dict;
+    # the worst case of the small race here is one duplicate fetch
+    if not lock.locked():
+        _schedule_fetch_locks.pop(cache_key, None)
 
-        return result
+    return result
 
-    except Exception as e:
-        logger.error(f"Error in get_conference_schedule_tool: {e}")
-        return f"Error retrieving conference schedule: {str(e)}"
+async def _build_schedule_reply(
+    speaker_name: Optional[str],
+    topic: Optional[str],
+    conference_room_name: Optional[str],
+    track_name: Optional[str],
+    conference_date: Optional[str],
+    query_type: str,
+    output_format: str
+) -> Union[str, Dict[str, Any]]:
+    """Fetch and format the schedule; uncached worker for the tool above."""
+    structured = output_format == "structured"
+
+    # Convert date string to date object if provided
+    parsed_date = None
+    if conference_date:
+        try:
+            parsed_date = _parse_ymd(conference_date)
+        except ValueError:
+            message = f"Invalid date format: {conference_date}. Please use YYYY-MM-DD format."
+            return {"error": message} if structured else message
+
+    # The list query types need every row to deduplicate names; detailed
+    # listings cap at 5, so the limit is pushed into the DB query and only
+    # 5 rows cross the wire while the exact total rides along for the header
+    is_listing = query_type in ("rooms_list", "speakers_list", "tracks_list")
+
+    # Get schedule from database
+    schedule, total = await db_client.get_conference_schedule(
+        speaker_name=speaker_name,
+        topic=topic,
+        conference_room_name=conference_room_name,
+        track_name=track_name,
+        conference_date=parsed_date,
+        limit=None if is_listing else 5
+    )
+
+    if not schedule:
+        if structured:
+            return {"total": 0, "shown": 0, "items": []}
+        filter_text = " and ".join(
+            f"{label} '{value}'"
+            for label, value in (
+                ("speaker", speaker_name), ("topic", topic),
+                ("room", conference_room_name), ("track", track_name),
+                ("date", conference_date)
+            )
+            if value
+        ) or "your criteria"
+        return f"No conference sessions found for {filter_text}."
+
+    # Structured results skip the markdown rendering entirely; the API layer
+    # serializes the records with orjson in one pass
+    if structured:
+        return {
+            "total": total,
+            "shown": len(schedule),
+            "items": [
+                {
+                    "topic": session.get('topic'),
+                    "speaker": session.get('speaker_name'),
+                    "start_time": session.get('start_time_str'),
+                    "end_time": session.get('end_time_str'),
+                    "room": session.get('conference_room_name'),
+                    "track": session.get('track_name'),
+                    "date": session.get('conference_date'),
+                    "description": session.get('description')
+                }
+                for session in schedule
+            ]
+        }
+
+    # Handle different query types
+    if query_type == "rooms_list":
+        # Return unique room names
+        rooms = list(set(session.get('conference_room_name', 'Unknown') for session in schedule))
+        return f"Conference rooms available:\n\n" + "\n".join(f"• {room}" for room in sorted(rooms))
+    
+    elif query_type == "speakers_list":
+        # Return unique speaker names
+        speakers = list(set(session.get('speaker_name', 'Unknown') for session in schedule))
+        return f"Conference speakers:\n\n" + "\n".join(f"• {speaker}" for speaker in sorted(speakers))
+    
+    elif query_type == "tracks_list":
+        # Return unique track names
+        tracks = list(set(session.get('track_name', 'Unknown') for session in schedule))
+        return f"Conference tracks:\n\n" + "\n".join(f"• {track}" for track in sorted(tracks))
+
+    # For detailed session information the DB already limited the rows;
+    # the header reports the true pre-limit total, not the truncated length
+    if total > len(schedule):
+        parts = [f"Found {total} conference sessions (showing first {len(schedule)}):\n\n"]
+    else:
+        parts = [f"Found {total} conference session(s):\n\n"]
+
+    for session in schedule:
+        # Display times are pre-formatted by db_client right after the fetch
+        parts.append(f"**{session.get('topic', 'Unknown Topic')}**\n")
+        parts.append(f"Speaker: {session.get('speaker_name', 'TBD')}\n")
+        parts.append(f"Time: {session.get('start_time_str', 'TBD')} - {session.get('end_time_str', 'TBD')}\n")
+        parts.append(f"Room: {session.get('conference_room_name', 'TBD')}\n")
+        parts.append(f"Track: {session.get('track_name', 'TBD')}\n")
+        parts.append(f"Date: {session.get('conference_date', 'TBD')}\n")
+
+        if session.get('description'):
+            parts.append(f"Description: {session.get('description')}\n")
+
+        parts.append("\n")
+
+    return "".join(parts)
+
+# Attendee and business data changes slowly, so exact-repeat tool calls are
+# served from short TTL caches; the business cache is cleared whenever a new
+# business is written so fresh listings appear immediately.
+_TOOL_CACHE_TTL = int(os.getenv("TOOL_CACHE_TTL", "30"))
+_attendee_cache: TTLCache = TTLCache(maxsize=512, ttl=_TOOL_CACHE_TTL)
+_business_cache: TTLCache = TTLCache(maxsize=512, ttl=_TOOL_CACHE_TTL)
+_organization_cache: TTLCache = TTLCache(maxsize=256, ttl=_TOOL_CACHE_TTL)
+
+def invalidate_business_cache() -> None:
+    """Drop cached business search replies after a business write."""
+    _business_cache.clear()
 
 async def search_attendees_tool(
     name: Optional[str] = None,
     limit: int = 10
 ) -> str:
     """Search for conference attendees by name or get all attendees."""
+    cache_key = (name, limit)
+    cached = _attendee_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         if name:
             # Search by name
@@ -289,46 +483,44 @@ async def search_attendees_tool(
 
         if not attendees:
             search_text = f"named '{name}'" if name else "in the conference"
-            return f"No attendees found {search_text}."
+            reply = f"No attendees found {search_text}."
+        else:
+            # Format attendee information
+            parts = [f"Found {len(attendees)} attendee(s):\n\n"]
 
-        # Format attendee information
-        result = f"Found {len(attendees)} attendee(s):\n\n"
-        
-        for attendee in attendees:
-            details = attendee.get('details', {})
-            user_name = details.get('user_name') or f"{details.get('firstName', '')} {details.get('lastName', '')}".strip()
-            
-            result += f"**{user_name}**\n"
-            
-            if details.get('company'):
-                result += f"Company: {details.get('company')}\n"
-            if details.get('location'):
-                result += f"Location: {details.get('location')}\n"
-            if details.get('primary_stream'):
-                result += f"Primary Stream: {details.get('primary_stream')}\n"
-            if details.get('secondary_stream'):
-                result += f"Secondary Stream: {details.get('secondary_stream')}\n"
-            if details.get('conference_package'):
-                result += f"Conference Package: {details.get('conference_package')}\n"
-            if details.get('email'):
-                result += f"Email: {details.get('email')}\n"
-            if details.get('mobile'):
-                result += f"Mobile: {details.get('mobile')}\n"
-            
-            result += "\n"
+            for attendee in attendees:
+                details = attendee.get('details', {})
+                user_name = details.get('user_name') or f"{details.get('firstName', '')} {details.get('lastName', '')}".strip()
 
-        return result
+                parts.append(f"**{user_name}**\n")
+
+                for key, label in _ATTENDEE_FIELDS:
+                    value = details.get(key)
+                    if value:
+                        parts.append(f"{label}: {value}\n")
+
+                parts.append("\n")
+
+            reply = "".join(parts)
 
     except Exception as e:
-        logger.error(f"Error in search_attendees_tool: {e}")
+        logger.error("Error in search_attendees_tool: %s", e)
         return f"Error searching attendees: {str(e)}"
 
+    _attendee_cache[cache_key] = reply
+    return reply
+
 async def search_businesses_tool(
     query: Optional[str] = None,
     sector: Optional[str] = None,
     location: Optional[str] = None
 ) -> str:
     """Search for businesses by various criteria."""
+    cache_key = (query, sector, location)
+    cached = _business_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         businesses = await db_client.search_businesses(
             query=query,
@@ -337,43 +529,37 @@ async def search_businesses_tool(
         )
 
         if not businesses:
-            filters = []
-            if query: filters.append(f"query '{query}'")
-            if sector: filters.append(f"sector '{sector}'")
-            if location: filters.append(f"location '{location}'")
-            
-            filter_text = " and ".join(filters) if filters else "your criteria"
-            return f"No businesses found for {filter_text}."
+            filter_text = " and ".join(
+                f"{label} '{value}'"
+                for label, value in (("query", query), ("sector", sector), ("location", location))
+                if value
+            ) or "your criteria"
+            reply = f"No businesses found for {filter_text}."
+        else:
+            # Format business information
+            parts = [f"Found {len(businesses)} business(es):\n\n"]
 
-        # Format business information
-        result = f"Found {len(businesses)} business(es):\n\n"
-        
-        for business in businesses:
-            details = business.get('details', {})
-            
-            result += f"**{details.get('companyName', 'Unknown Company')}**\n"
-            
-            if details.get('industrySector'):
-                result += f"Industry: {details.get('industrySector')}\n"
-            if details.get('subSector'):
-                result += f"Sub-sector: {details.get('subSector')}\n"
-            if details.get('location'):
-                result += f"Location: {details.get('location')}\n"
-            if details.get('briefDescription'):
-                result += f"Description: {details.get('briefDescription')}\n"
-            if details.get('productsOrServices'):
-                result += f"Products/Services: {details.get('productsOrServices')}\n"
-            if details.get('web'):
-                result += f"Website: {details.get('web')}\n"
-            
-            result += "\n"
+            for business in businesses:
+                details = business.get('details', {})
 
-        return result
+                parts.append(f"**{details.get('companyName', 'Unknown Company')}**\n")
+
+                for key, label in _BUSINESS_FIELDS:
+                    value = details.get(key)
+                    if value:
+                        parts.append(f"{label}: {value}\n")
+
+                parts.append("\n")
+
+            reply = "".join(parts)
 
     except Exception as e:
-        logger.error(f"Error in search_businesses_tool: {e}")
+        logger.error("Error in search_businesses_tool: %s", e)
         return f"Error searching businesses: {str(e)}"
 
+    _business_cache[cache_key] = reply
+    return reply
+
 async def get_user_businesses_tool(
     user_id: str,
     user_name: Optional[str] = None
@@ -391,34 +577,24 @@ async def get_user_businesses_tool(
             return f"No businesses found for {user_text}."
 
         # Format business information
-        result = f"Found {len(businesses)} business(es) for {user_name or 'you'}:\n\n"
-        
+        parts = [f"Found {len(businesses)} business(es) for {user_name or 'you'}:\n\n"]
+
         for business in businesses:
             details = business.get('details', {})
-            
-            result += f"**{details.get('companyName', 'Unknown Company')}**\n"
-            
-            if details.get('industrySector'):
-                result += f"Industry: {details.get('industrySector')}\n"
-            if details.get('subSector'):
-                result += f"Sub-sector: {details.get('subSector')}\n"
-            if details.get('location'):
-                result += f"Location: {details.get('location')}\n"
-            if details.get('positionTitle'):
-                result += f"Position: {details.get('positionTitle')}\n"
-            if details.get('briefDescription'):
-                result += f"Description: {details.get('briefDescription')}\n"
-            if details.get('productsOrServices'):
-                result += f"Products/Services: {details.get('productsOrServices')}\n"
-            if details.get('web'):
-                result += f"Website: {details.get('web')}\n"
-            
-            result += "\n"
 
-        return result
+            parts.append(f"**{details.get('companyName', 'Unknown Company')}**\n")
+
+            for key, label in _USER_BUSINESS_FIELDS:
+                value = details.get(key)
+                if value:
+                    parts.append(f"{label}: {value}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(f"Error in get_user_businesses_tool: {e}")
+        logger.error("Error in get_user_businesses_tool: %s", e)
         return f"Error retrieving user businesses: {str(e)}"
 
 async def add_business_tool(
@@ -459,47 +635,165 @@ async def add_business_tool(
         success = await db_client.add_business(user_id, business_details)
 
         if success:
+            # New listing should show up in searches right away
+            invalidate_business_cache()
             return f"Successfully added business '{company_name}' to your profile. The business is now listed in the business directory and available for networking."
         else:
             return f"Failed to add business '{company_name}'. Please try again or contact support."
 
     except Exception as e:
-        logger.error(f"Error in add_business_tool: {e}")
+        logger.error("Error in add_business_tool: %s", e)
         return f"Error adding business: {str(e)}"
 
 async def get_organization_info_tool(
     organization_id: Optional[str] = None
 ) -> str:
     """Get organization information."""
-    try:
-        if not organization_id:
-            return "No organization specified."
+    if not organization_id:
+        return "No organization specified."
 
+    cached = _organization_cache.get(organization_id)
+    if cached is not None:
+        return cached
+
+    try:
         organization = await db_client.get_organization_details(organization_id)
 
         if not organization:
-            return f"No organization found with ID '{organization_id}'."
+            reply = f"No organization found with ID '{organization_id}'."
+        else:
+            # Format organization information
+            parts = [
+                "**Organization Information**\n\n",
+                f"Name: {organization.get('name', 'Unknown')}\n"
+            ]
 
-        # Format organization information
-        result = f"**Organization Information**\n\n"
-        result += f"Name: {organization.get('name', 'Unknown')}\n"
-        
-        details = organization.get('details', {})
-        if details:
-            for key, value in details.items():
-                if value:
-                    result += f"{key.replace('_', ' ').title()}: {value}\n"
+            details = organization.get('details', {})
+            if details:
+                for key, value in details.items():
+                    if value:
+                        parts.append(f"{key.replace('_', ' ').title()}: {value}\n")
 
-        return result
+            reply = "".join(parts)
 
     except Exception as e:
-        logger.error(f"Error in get_organization_info_tool: {e}")
+        logger.error("Error in get_organization_info_tool: %s", e)
         return f"Error retrieving organization information: {str(e)}"
 
+    _organization_cache[organization_id] = reply
+    return reply
+
 # =========================
 # AGENT EXECUTION FUNCTIONS
 # =========================
 
+# Routing keyword tables. The message is tokenized once and matched against
+# these frozensets in O(1); multi-word phrases still need a substring check.
+_WORD_RE = re.compile(r"\w+")
+
+_SCHEDULE_WORDS = frozenset({
+    "schedule", "schedules", "session", "sessions", "speaker", "speakers",
+    "time", "times", "timing", "timings", "room", "rooms", "track", "tracks",
+    "when", "agenda", "program", "july", "date", "dates", "events", "september"
+})
+_NETWORKING_WORDS = frozenset({
+    "network", "networks", "networking", "business", "businesses",
+    "attendee", "attendees", "connect", "connects", "connecting",
+    "connection", "connections", "company", "about"
+})
+
+_SCHEDULE_PHRASES = ("tell me about speaker", "about speaker")
+_NETWORKING_PHRASES = (
+    "find people", "add business", "register business",
+    "show attendees", "my business", "tell about", "tell me about"
+)
+
+_AGENT_ERROR_REPLY = "I'm having trouble processing your request. Please try again or rephrase your question."
+
+# Triage replies, built once. Greeting detection is token-based so "hi"
+# no longer matches inside words like "this" or "history".
+_GREETING_WORDS = frozenset({"hello", "hi", "hey", "greetings"})
+_GREETING_TEMPLATE = (
+    "Hello {user_name}! 👋 Welcome to Business Conference 2025!\n\n"
+    "I'm your conference assistant and I'm here to help you with:\n\n"
+    "🗓️ **Conference Schedule** - Find sessions, speakers, timings, and rooms\n"
+    "🤝 **Networking** - Connect with attendees and explore business opportunities\n\n"
+    "What would you like to know about the conference today?"
+)
+_HELP_REPLY = (
+    "I'm your conference assistant for Business Conference 2025. I can help you with:\n\n"
+    "🗓️ **Conference Schedule** - Find sessions, speakers, timings, and rooms\n"
+    "🤝 **Networking** - Connect with attendees and explore business opportunities\n\n"
+    "What would you like to know about the conference?"
+)
+
+# Static agent replies, hoisted so the handlers return shared constants
+# instead of rebuilding the multi-line literals on every miss.
+_NO_JULY_1_REPLY = (
+    "No conference sessions are scheduled for July 1st. The Business Conference 2025 "
+    "is scheduled for July 15-16, 2025. Would you like to see the sessions for those dates?"
+)
+_NO_SEPTEMBER_REPLY = (
+    "No conference sessions are scheduled for September. The Business Conference 2025 "
+    "is scheduled for July 15-16, 2025. Would you like to see the sessions for those dates instead?"
+)
+_NETWORKING_HELP = (
+    "I can help you with networking and business connections. You can ask me to:\n\n"
+    "• **Find attendees** - \"Find attendees from Chennai\" or \"Show me all attendees\"\n"
+    "• **Search businesses** - \"Find healthcare businesses\" or \"Show me IT companies\"\n"
+    "• **Add your business** - \"I want to add my business\"\n"
+    "• **View your businesses** - \"Show my business\"\n"
+    "• **Get business info** - \"Show me businesses in Mumbai\"\n"
+    "• **Find specific people** - \"Tell me about [person name]\"\n\n"
+    "What networking assistance do you need?"
+)
+
+async def route_and_execute(message: str, context: Dict[str, Any]) -> Tuple[str, str]:
+    """Route a chat message to an agent and return (agent_name, response).
+
+    Routing is deterministic keyword matching rather than a router model —
+    the live chat path makes no LLM calls — but keeping it here, next to the
+    agents it dispatches to, means the endpoint no longer duplicates the
+    keyword tables and a routing change touches one module.
+    """
+    message_lower = message.lower()
+    tokens = set(_WORD_RE.findall(message_lower))
+
+    if tokens & _SCHEDULE_WORDS or any(phrase in message_lower for phrase in _SCHEDULE_PHRASES):
+        agent_name = "Schedule Agent"
+        try:
+            response = await execute_schedule_agent(message, context)
+        except Exception as e:
+            logger.error("Error executing agent %s: %s", agent_name, e)
+            response = _AGENT_ERROR_REPLY
+
+    elif tokens & _NETWORKING_WORDS or any(phrase in message_lower for phrase in _NETWORKING_PHRASES):
+        agent_name = "Networking Agent"
+        try:
+            response = await execute_networking_agent(message, context)
+        except Exception as e:
+            logger.error("Error executing agent %s: %s", agent_name, e)
+            response = _AGENT_ERROR_REPLY
+
+    else:
+        agent_name = "Triage Agent"
+        if tokens & _GREETING_WORDS:
+            user_name = context.get('passenger_name') or "there"
+            response = _GREETING_TEMPLATE.format(user_name=user_name)
+        else:
+            response = _HELP_REPLY
+
+    return agent_name, response
+
+async def multi_lookup(**tasks) -> Dict[str, Any]:
+    """Run independent async lookups concurrently, mapping results by name.
+
+    The agent handlers are I/O-bound on the DB, so overlapping their fan-out
+    calls with gather costs one round trip instead of one per lookup.
+    """
+    results = await asyncio.gather(*tasks.values())
+    return dict(zip(tasks, results))
+
 async def execute_schedule_agent(message: str, context: Dict[str, Any]) -> str:
     """Execute schedule agent logic."""
     try:
@@ -508,39 +802,38 @@ async def execute_schedule_agent(message: str, context: Dict[str, Any]) -> str:
         # Determine query type
         query_type = determine_query_type(message)
         
-        # Extract parameters from message using helper functions
+        # Extract parameters from message using helper functions; track and
+        # room come out of one shared keyword scan
         speaker_name = extract_speaker_from_message(message)
-        track_name = extract_track_from_message(message)
-        room_name = extract_room_from_message(message)
+        slots = scan_schedule_slots(message_lower)
+        track_name = slots.get("track")
+        room_name = slots.get("room")
         date_str = parse_date_from_message(message)
         
-        # Handle specific date queries
-        if "july 1" in message_lower:
-            return "No conference sessions are scheduled for July 1st. The Business Conference 2025 is scheduled for July 15-16, 2025. Would you like to see the sessions for those dates?"
-        
+        # Handle specific date queries; the word boundary keeps "july 1"
+        # from swallowing "july 15"/"july 16"
+        if _JULY_1_RE.search(message_lower):
+            return _NO_JULY_1_REPLY
+
         # If asking about September but no data exists for that date, inform user
-        if "september" in message_lower:
-            return "No conference sessions are scheduled for September. The Business Conference 2025 is scheduled for July 15-16, 2025. Would you like to see the sessions for those dates instead?"
+        if _SEPTEMBER_RE.search(message_lower):
+            return _NO_SEPTEMBER_REPLY
         
         # Handle specific queries about speakers
         if query_type == "speakers_list" or ("speakers" in message_lower and not date_str):
-            # Show all speakers for both days
-            result1 = await get_conference_schedule_tool(conference_date="2025-07-15", query_type="speakers_list")
-            result2 = await get_conference_schedule_tool(conference_date="2025-07-16", query_type="speakers_list")
-            
+            # Show all speakers for both days; the two day fetches are
+            # independent, so overlap them instead of awaiting in sequence
+            schedules = await multi_lookup(
+                schedule_15=db_client.get_conference_schedule(conference_date=date(2025, 7, 15)),
+                schedule_16=db_client.get_conference_schedule(conference_date=date(2025, 7, 16))
+            )
+
             # Combine and deduplicate speakers
-            speakers_15 = set()
-            speakers_16 = set()
-            
-            schedule_15 = await db_client.get_conference_schedule(conference_date=date(2025, 7, 15))
-            schedule_16 = await db_client.get_conference_schedule(conference_date=date(2025, 7, 16))
-            
-            for session in schedule_15:
-                speakers_15.add(session.get('speaker_name', 'Unknown'))
-            for session in schedule_16:
-                speakers_16.add(session.get('speaker_name', 'Unknown'))
-            
-            all_speakers = sorted(speakers_15.union(speakers_16))
+            all_speakers = sorted({
+                session.get('speaker_name', 'Unknown')
+                for sessions, _total in schedules.values()
+                for session in sessions
+            })
             return f"Conference speakers ({len(all_speakers)} total):\n\n" + "\n".join(f"• {speaker}" for speaker in all_speakers)
         
         # Handle rooms query
@@ -576,144 +869,278 @@ async def execute_schedule_agent(message: str, context: Dict[str, Any]) -> str:
         return result
         
     except Exception as e:
-        logger.error(f"Error in execute_schedule_agent: {e}")
+        logger.error("Error in execute_schedule_agent: %s", e)
         return "I'm having trouble accessing the conference schedule. Please try again or contact support."
 
+# Token tables for the networking dispatch: the message is tokenized once and
+# classified with set/dict lookups instead of a substring scan per keyword
+# (which also let "it" fire inside unrelated words). Dict iteration order
+# preserves the old elif precedence — sectors before locations.
+_TOKEN_RE = re.compile(r"[a-z][a-z']*")
+_BUSINESS_WORDS = frozenset({"business", "businesses"})
+_ATTENDEE_WORDS = frozenset({"attendee", "attendees"})
+_BUSINESS_SEARCH_WORDS = frozenset({"business", "businesses", "company", "companies"})
+_SECTOR_TOKENS = {
+    "healthcare": "Healthcare",
+    "pharma": "Pharma & Healthcare",
+    "it": "Technology",
+    "technology": "Technology"
+}
+_LOCATION_TOKENS = {
+    "mumbai": "Mumbai",
+    "chennai": "Chennai",
+    "tamilnadu": "Tamil Nadu",
+    "nadu": "Tamil Nadu"
+}
+
 async def execute_networking_agent(message: str, context: Dict[str, Any]) -> str:
     """Execute networking agent logic."""
     try:
         message_lower = message.lower()
-        
+        # One tokenization feeds every word-level check below; multi-word
+        # phrases ("my business", "new business") stay substring checks
+        tokens = set(_TOKEN_RE.findall(message_lower))
+
         # Handle business form request - be more specific about when to show form
-        if ("add" in message_lower and "business" in message_lower) or \
-           ("register" in message_lower and "business" in message_lower) or \
+        if (tokens & _BUSINESS_WORDS and ("add" in tokens or "register" in tokens)) or \
            ("new business" in message_lower) or \
            ("create business" in message_lower) or \
            ("i want to add my business" in message_lower):
             return "DISPLAY_BUSINESS_FORM"
-        
+
         # Handle user's own business lookup - be very specific
         if ("my business" in message_lower or "show about my business" in message_lower) and context.get('customer_id'):
+            # Compound intent ("my businesses in Mumbai"): fetch the user's
+            # own listings and the area search concurrently instead of
+            # dropping the location filter
+            location = next((l for t, l in _LOCATION_TOKENS.items() if t in tokens), None)
+            if location:
+                results = await multi_lookup(
+                    own=get_user_businesses_tool(context['customer_id'], context.get('passenger_name')),
+                    nearby=search_businesses_tool(location=location)
+                )
+                return (
+                    f"**Your businesses**\n\n{results['own']}\n\n"
+                    f"**Businesses in {location}**\n\n{results['nearby']}"
+                )
             return await get_user_businesses_tool(context['customer_id'], context.get('passenger_name'))
-        
+
         # Handle specific person lookup
         person_name = extract_person_name_from_message(message)
-        if person_name and ("tell" in message_lower or "about" in message_lower):
+        if person_name and ("tell" in tokens or "about" in tokens):
             # Search for specific person
             return await search_attendees_tool(name=person_name)
-        
-        # Handle attendee search
-        if "attendee" in message_lower or "show attendees" in message_lower or "find attendees" in message_lower:
-            if "from" in message_lower:
-                # Extract location
-                words = message.split()
-                location_idx = -1
-                for i, word in enumerate(words):
-                    if word.lower() == "from":
-                        location_idx = i
-                        break
-                
-                if location_idx != -1 and location_idx + 1 < len(words):
-                    location = words[location_idx + 1]
-                    # For now, just return all attendees since location filtering needs more complex implementation
-                    return await search_attendees_tool()
-                else:
-                    return await search_attendees_tool()
-            else:
-                return await search_attendees_tool()
+
+        # Handle attendee search. A "from <location>" qualifier is ignored
+        # for now — location filtering needs server-side support in the
+        # attendee search — so all attendees are returned either way.
+        if tokens & _ATTENDEE_WORDS:
+            return await search_attendees_tool()
         
         # Handle general business search (not user's own business)
-        if ("business" in message_lower or "company" in message_lower or "companies" in message_lower) and \
+        if tokens & _BUSINESS_SEARCH_WORDS and \
            not ("my business" in message_lower or "show about my business" in message_lower):
-            if "healthcare" in message_lower:
-                return await search_businesses_tool(sector="Healthcare")
-            elif "pharma" in message_lower:
-                return await search_businesses_tool(sector="Pharma & Healthcare")
-            elif "it" in message_lower or "technology" in message_lower:
-                return await search_businesses_tool(sector="Technology")
-            elif "mumbai" in message_lower:
-                return await search_businesses_tool(location="Mumbai")
-            elif "chennai" in message_lower:
-                return await search_businesses_tool(location="Chennai")
-            elif "tamil nadu" in message_lower or "tamilnadu" in message_lower:
-                return await search_businesses_tool(location="Tamil Nadu")
-            else:
-                return await search_businesses_tool()
-        
+            # Table lookups on the token set; fixes e.g. "it" matching
+            # inside unrelated words via the old substring scans
+            sector = next((s for t, s in _SECTOR_TOKENS.items() if t in tokens), None)
+            location = next((l for t, l in _LOCATION_TOKENS.items() if t in tokens), None)
+
+            if sector or location:
+                # Compound queries ("healthcare businesses in Mumbai") keep
+                # both filters in one AND'ed search instead of dropping one
+                return await search_businesses_tool(sector=sector, location=location)
+
+            return await search_businesses_tool()
+
         # Handle organization info
-        if "organization" in message_lower and context.get('organization_id'):
+        if "organization" in tokens and context.get('organization_id'):
             return await get_organization_info_tool(context.get('organization_id'))
         
         # Default networking response
-        return "I can help you with networking and business connections. You can ask me to:\n\n• **Find attendees** - \"Find attendees from Chennai\" or \"Show me all attendees\"\n• **Search businesses** - \"Find healthcare businesses\" or \"Show me IT companies\"\n• **Add your business** - \"I want to add my business\"\n• **View your businesses** - \"Show my business\"\n• **Get business info** - \"Show me businesses in Mumbai\"\n• **Find specific people** - \"Tell me about [person name]\"\n\nWhat networking assistance do you need?"
+        return _NETWORKING_HELP
         
     except Exception as e:
-        logger.error(f"Error in execute_networking_agent: {e}")
+        logger.error("Error in execute_networking_agent: %s", e)
         return "I'm having trouble accessing the networking information. Please try again or contact support."
 
 # =========================
 # CONVERSATION MANAGEMENT
 # =========================
 
-# In-memory storage for conversations (in production, use a proper database)
-conversations: Dict[str, Dict[str, Any]] = {}
+# In-memory storage for conversations (in production, use a proper database).
+# Bounded LRU so bogus or abandoned conversation ids can't grow RSS forever;
+# message/event history is capped per conversation for the same reason.
+conversations: LRUCache = LRUCache(maxsize=int(os.getenv("CONV_CACHE_SIZE", "10000")))
+
+_MAX_MESSAGES = 200
+_MAX_EVENTS = 500
 
 def get_or_create_conversation(conversation_id: Optional[str], account_number: Optional[str]) -> Dict[str, Any]:
     """Get existing conversation or create a new one."""
     if not conversation_id:
-        conversation_id = str(uuid.uuid4())
-    
+        # .hex skips the hyphenated formatting and hashes faster as a dict key
+        conversation_id = uuid.uuid4().hex
+
     if conversation_id not in conversations:
         conversations[conversation_id] = {
             "id": conversation_id,
             "context": AirlineAgentContext(),
             "current_agent": "Triage Agent",
-            "messages": [],
-            "events": [],
-            "account_number": account_number
+            "messages": deque(maxlen=_MAX_MESSAGES),
+            "events": deque(maxlen=_MAX_EVENTS),
+            "account_number": account_number,
+            # Per-conversation lock so concurrent turns on the same id
+            # can be serialized by the endpoint.
+            "lock": asyncio.Lock()
         }
-    
+        refresh_context_snapshot(conversations[conversation_id])
+
     return conversations[conversation_id]
 
+def refresh_context_snapshot(conversation: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-dump the conversation context after a mutation and cache the result.
+
+    The snapshot is what gets serialized into every chat response, so dumping
+    it once per mutation instead of once per request keeps serialization off
+    the hot path. The customer_info block of the chat payload is derived from
+    the same fields and is rebuilt here for the same reason.
+    """
+    snapshot = asdict(conversation["context"])
+    conversation["context_dict"] = snapshot
+
+    if snapshot.get("customer_id"):
+        conversation["customer_info"] = {
+            "customer": {
+                "name": snapshot.get("passenger_name"),
+                "account_number": snapshot.get("account_number"),
+                "email": snapshot.get("customer_email"),
+                "is_conference_attendee": snapshot.get("is_conference_attendee"),
+                "conference_name": snapshot.get("conference_name"),
+                "registration_id": snapshot.get("user_registration_id"),
+                "company": snapshot.get("user_company_name"),
+                "location": snapshot.get("user_location"),
+                "conference_package": snapshot.get("user_conference_package"),
+                "primary_stream": snapshot.get("user_primary_stream"),
+                "secondary_stream": snapshot.get("user_secondary_stream")
+            },
+            "bookings": []
+        }
+    else:
+        conversation["customer_info"] = None
+
+    return snapshot
+
+# Cache resolved users so repeat conversations for the same attendee skip the DB
+_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=int(os.getenv("USER_CACHE_TTL", "300")))
+
+# One lock per identifier so a burst of reconnects for the same user fires a
+# single DB lookup; the rest wait and read the freshly cached entry.
+_user_fetch_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+async def fetch_user(identifier: str) -> Optional[Dict[str, Any]]:
+    """Fetch a user by identifier, serving repeat lookups from the TTL cache."""
+    user = _user_cache.get(identifier)
+    if user is not None:
+        return user
+
+    lock = _user_fetch_locks[identifier]
+    async with lock:
+        # Re-check: another coroutine may have filled the cache while we waited
+        user = _user_cache.get(identifier)
+        if user is None:
+            user = await db_client.get_user_by_identifier(identifier)
+            if user:
+                _user_cache[identifier] = user
+
+    # Drop idle locks so unknown identifiers can't grow the dict forever;
+    # the worst case of the small race here is one duplicate fetch
+    if not lock.locked():
+        _user_fetch_locks.pop(identifier, None)
+
+    return user
+
+def invalidate_user_cache(identifier: str) -> None:
+    """Drop a cached user entry, e.g. after a profile edit."""
+    _user_cache.pop(identifier, None)
+
+async def prewarm_user_cache() -> int:
+    """Bulk-load every user into the TTL cache with one SELECT.
+
+    Entries are keyed by both registration id and user id so either
+    identifier hits the cache. Returns the number of users loaded.
+    """
+    users = await db_client.list_all_users()
+    for user in users:
+        registration_id = user.get("registration_id")
+        if registration_id:
+            _user_cache[str(registration_id)] = user
+        if user.get("id"):
+            _user_cache[user["id"]] = user
+    return len(users)
+
+# (context attribute, user-record key) pairs copied by load_user_context.
+# The two defaulted fields (is_conference_attendee, conference_name) are set
+# explicitly below.
+_USER_FIELD_MAP = (
+    ("passenger_name", "name"),
+    ("customer_id", "id"),
+    ("account_number", "account_number"),
+    ("customer_email", "email"),
+    ("user_company_name", "company"),
+    ("user_location", "location"),
+    ("user_registration_id", "registration_id"),
+    ("user_conference_package", "conference_package"),
+    ("user_primary_stream", "primary_stream"),
+    ("user_secondary_stream", "secondary_stream")
+)
+
+# Fields drawn from a small shared vocabulary (the same company, city or
+# stream recurs across attendees) are interned so concurrent conversations
+# share one string object per distinct value.
+_INTERNED_USER_FIELDS = frozenset({
+    "user_company_name", "user_location", "user_conference_package",
+    "user_primary_stream", "user_secondary_stream"
+})
+
 async def load_user_context(conversation: Dict[str, Any], account_number: str) -> bool:
     """Load user context from database."""
     try:
-        # First try to get user by registration_id
-        user = await db_client.get_user_by_registration_id(account_number)
-        
-        # If not found, try by QR code (user ID)
-        if not user:
-            user = await db_client.get_user_by_qr_code(account_number)
-        
+        # Cached lookup that covers both registration ID and QR code
+        user = await fetch_user(account_number)
+
         if user:
-            # Update context with user information
-            conversation["context"].passenger_name = user.get("name")
-            conversation["context"].customer_id = user.get("id")
-            conversation["context"].account_number = user.get("account_number")
-            conversation["context"].customer_email = user.get("email")
-            conversation["context"].is_conference_attendee = user.get("is_conference_attendee", True)
-            conversation["context"].conference_name = user.get("conference_name", "Business Conference 2025")
-            
-            # Add additional user details
-            conversation["context"].user_company_name = user.get("company")
-            conversation["context"].user_location = user.get("location")
-            conversation["context"].user_registration_id = user.get("registration_id")
-            conversation["context"].user_conference_package = user.get("conference_package")
-            conversation["context"].user_primary_stream = user.get("primary_stream")
-            conversation["context"].user_secondary_stream = user.get("secondary_stream")
-            
+            # Update context with user information; the context is slotted,
+            # so a setattr loop over the field map replaces the old
+            # per-field assignment block
+            ctx = conversation["context"]
+            get = user.get
+            for attr, key in _USER_FIELD_MAP:
+                value = get(key)
+                if attr in _INTERNED_USER_FIELDS and isinstance(value, str):
+                    value = sys.intern(value)
+                setattr(ctx, attr, value)
+            ctx.is_conference_attendee = get("is_conference_attendee", True)
+            ctx.conference_name = get("conference_name", "Business Conference 2025")
+
+            refresh_context_snapshot(conversation)
+
             return True
-        
+
         return False
     except Exception as e:
-        logger.error(f"Error loading user context: {e}")
+        logger.error("Error loading user context: %s", e)
         return False
 
 # Export the main components for use in api.py
 __all__ = [
     'conversations',
     'get_or_create_conversation',
+    'refresh_context_snapshot',
     'load_user_context',
+    'fetch_user',
+    'invalidate_user_cache',
+    'prewarm_user_cache',
+    'route_and_execute',
     'execute_schedule_agent',
     'execute_networking_agent',
     'get_conference_schedule_tool',
@@ -721,5 +1148,6 @@ __all__ = [
     'search_businesses_tool',
     'get_user_businesses_tool',
     'add_business_tool',
+    'invalidate_business_cache',
     'get_organization_info_tool'
 ]
\ No newline at end of file
@@ -1,6 +1,9 @@
 # python-backend/shared_types.py
 
-from pydantic import BaseModel, Field
+from dataclasses import field
+
+from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
 
@@ -8,11 +11,16 @@ from datetime import date, datetime
 # CONTEXT
 # =========================
 
-class AirlineAgentContext(BaseModel):
+@dataclass(slots=True)
+class AirlineAgentContext:
     """
     Context for airline customer service agents,
     now expanded to include conference and potential future domains.
     This context is shared across all agents.
+
+    A slotted pydantic dataclass rather than a BaseModel: one instance lives
+    in every cached conversation, so the fixed slot layout keeps the
+    per-conversation footprint small and attribute writes cheap.
     """
     # --- Existing Airline/Customer Fields ---
     passenger_name: Optional[str] = None
@@ -24,7 +32,7 @@ class AirlineAgentContext(BaseModel):
     booking_id: Optional[str] = None
     flight_id: Optional[str] = None
     customer_email: Optional[str] = None
-    customer_bookings: List[Dict[str, Any]] = Field(default_factory=list)
+    customer_bookings: List[Dict[str, Any]] = field(default_factory=list)
 
     # --- Conference & Delegate-Specific Fields ---
     is_conference_attendee: Optional[bool] = False
@@ -32,15 +40,20 @@ class AirlineAgentContext(BaseModel):
     user_conference_role: Optional[str] = None # e.g., "attendee", "speaker", "organizer"
     user_job_title: Optional[str] = None
     user_company_name: Optional[str] = None
+    user_location: Optional[str] = None
+    user_registration_id: Optional[str] = None
+    user_conference_package: Optional[str] = None
+    user_primary_stream: Optional[str] = None
+    user_secondary_stream: Optional[str] = None
     user_bio: Optional[str] = None
-    user_social_media_links: Optional[Dict[str, str]] = Field(default_factory=dict)
-    user_contact_info: Optional[Dict[str, str]] = Field(default_factory=dict)
-    user_registered_tracks: List[str] = Field(default_factory=list)
-    user_conference_interests: List[str] = Field(default_factory=list)
-    user_personal_schedule_events: List[Dict[str, Any]] = Field(default_factory=list)
+    user_social_media_links: Optional[Dict[str, str]] = field(default_factory=dict)
+    user_contact_info: Optional[Dict[str, str]] = field(default_factory=dict)
+    user_registered_tracks: List[str] = field(default_factory=list)
+    user_conference_interests: List[str] = field(default_factory=list)
+    user_personal_schedule_events: List[Dict[str, Any]] = field(default_factory=list)
 
     # --- Placeholder for future Networking/Business Fields ---
-    # last_networking_search_results: List[Dict[str, Any]] = Field(default_factory=list)
+    # last_networking_search_results: List[Dict[str, Any]] = field(default_factory=list)
     # current_viewed_business_details: Optional[Dict[str, Any]] = None
 
 